@@ -0,0 +1,112 @@
+import os
+import struct
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from crcmod.predefined import mkPredefinedCrcFun
+
+from spacepackets.cfdp import ChecksumType, NULL_CHECKSUM_U32
+from tmtccmd.cfdp.filestore import HostFilestore
+from tmtccmd.cfdp.handler.crc import Crc32Helper
+from tmtccmd.cfdp.handler.defs import SourceFileDoesNotExist
+
+
+class TestCrc32Helper(TestCase):
+    def setUp(self) -> None:
+        self.file_path = Path(f"{tempfile.gettempdir()}/crc_helper_test.bin")
+        self.data = "Hello World\n".encode()
+        with open(self.file_path, "wb") as of:
+            of.write(self.data)
+        self.file_size = self.file_path.stat().st_size
+        self.segment_len = 4
+        self.crc32_func = mkPredefinedCrcFun("crc32")
+        self.crc_helper = Crc32Helper(ChecksumType.CRC_32, HostFilestore())
+
+    def _expected_digest(self, data: bytes) -> bytes:
+        return struct.pack("!I", self.crc32_func(data))
+
+    def test_digest_matches_crcmod(self):
+        digest = self.crc_helper.calc_for_file(
+            self.file_path, self.file_size, self.segment_len
+        )
+        self.assertEqual(digest, self._expected_digest(self.data))
+
+    def test_cache_disabled_by_default(self):
+        self.assertFalse(self.crc_helper.cache_digests)
+        self.crc_helper._calc_for_file = MagicMock(wraps=self.crc_helper._calc_for_file)
+        self.crc_helper.calc_for_file(self.file_path, self.file_size, self.segment_len)
+        self.crc_helper.calc_for_file(self.file_path, self.file_size, self.segment_len)
+        # Without opting into digest caching, every call hashes the file again
+        self.assertEqual(self.crc_helper._calc_for_file.call_count, 2)
+
+    def test_digest_cache_hit(self):
+        self.crc_helper.cache_digests = True
+        self.crc_helper._calc_for_file = MagicMock(wraps=self.crc_helper._calc_for_file)
+        digest = self.crc_helper.calc_for_file(
+            self.file_path, self.file_size, self.segment_len
+        )
+        cached_digest = self.crc_helper.calc_for_file(
+            self.file_path, self.file_size, self.segment_len
+        )
+        self.assertEqual(digest, cached_digest)
+        # The second call must be served from the digest cache
+        self.crc_helper._calc_for_file.assert_called_once()
+
+    def test_cache_respects_requested_size(self):
+        self.crc_helper.cache_digests = True
+        self.crc_helper.calc_for_file(self.file_path, self.file_size, self.segment_len)
+        partial_digest = self.crc_helper.calc_for_file(
+            self.file_path, 4, self.segment_len
+        )
+        # A smaller requested size must not be answered with the full file digest
+        self.assertEqual(partial_digest, self._expected_digest(self.data[0:4]))
+
+    def test_cache_invalidation_on_file_change(self):
+        self.crc_helper.cache_digests = True
+        first_digest = self.crc_helper.calc_for_file(
+            self.file_path, self.file_size, self.segment_len
+        )
+        new_data = "Goodbye World\n".encode()
+        with open(self.file_path, "wb") as of:
+            of.write(new_data)
+        # Ensure the modification time changes even on coarse filesystem clocks
+        stat = self.file_path.stat()
+        os.utime(self.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        second_digest = self.crc_helper.calc_for_file(
+            self.file_path, len(new_data), self.segment_len
+        )
+        self.assertNotEqual(first_digest, second_digest)
+        self.assertEqual(second_digest, self._expected_digest(new_data))
+
+    def test_clear_digest_cache(self):
+        self.crc_helper.cache_digests = True
+        self.crc_helper._calc_for_file = MagicMock(wraps=self.crc_helper._calc_for_file)
+        self.crc_helper.calc_for_file(self.file_path, self.file_size, self.segment_len)
+        self.crc_helper.clear_digest_cache()
+        self.crc_helper.calc_for_file(self.file_path, self.file_size, self.segment_len)
+        self.assertEqual(self.crc_helper._calc_for_file.call_count, 2)
+
+    def test_null_checksum_shortcut(self):
+        self.crc_helper.checksum_type = ChecksumType.NULL_CHECKSUM
+        digest = self.crc_helper.calc_for_file(
+            self.file_path, self.file_size, self.segment_len
+        )
+        self.assertEqual(digest, NULL_CHECKSUM_U32)
+
+    def test_invalid_segment_len(self):
+        with self.assertRaises(ValueError):
+            self.crc_helper.calc_for_file(self.file_path, self.file_size, 0)
+
+    def test_missing_file(self):
+        with self.assertRaises(SourceFileDoesNotExist):
+            self.crc_helper.calc_for_file(
+                Path(f"{tempfile.gettempdir()}/crc_helper_not_there.bin"),
+                self.file_size,
+                self.segment_len,
+            )
+
+    def tearDown(self) -> None:
+        if self.file_path.exists():
+            os.remove(self.file_path)
@@ -252,6 +252,82 @@ class TestCfdpDestHandler(TestCase):
         )
         self._state_checker(fsm_res, CfdpStates.IDLE, TransactionStep.IDLE)
 
+    def test_coalesced_in_order_segments(self):
+        # Both segments are inserted before a single state machine call, so the
+        # handler coalesces them into one filestore write
+        file_info = self.random_data_two_file_segments()
+        self._source_simulator_transfer_init_with_metadata(
+            checksum=ChecksumType.CRC_32,
+            file_size=file_info.file_size,
+            file_path=self.src_file_path.as_posix(),
+        )
+        self._insert_file_segment(file_info.rand_data[0 : self.file_segment_len], 0)
+        self._insert_file_segment(
+            file_info.rand_data[self.file_segment_len :], self.file_segment_len
+        )
+        fsm_res = self.dest_handler.state_machine()
+        self._state_checker(
+            fsm_res, CfdpStates.BUSY_CLASS_1_NACKED, TransactionStep.RECEIVING_FILE_DATA
+        )
+        # One indication per segment, even if the writes were merged
+        self.assertEqual(self.cfdp_user.file_segment_recv_indication.call_count, 2)
+        self._finish_transfer_and_verify_file(file_info)
+
+    def test_out_of_order_segments(self):
+        file_info = self.random_data_two_file_segments()
+        self._source_simulator_transfer_init_with_metadata(
+            checksum=ChecksumType.CRC_32,
+            file_size=file_info.file_size,
+            file_path=self.src_file_path.as_posix(),
+        )
+        self._insert_file_segment(
+            file_info.rand_data[self.file_segment_len :], self.file_segment_len
+        )
+        self._insert_file_segment(file_info.rand_data[0 : self.file_segment_len], 0)
+        fsm_res = self.dest_handler.state_machine()
+        self._state_checker(
+            fsm_res, CfdpStates.BUSY_CLASS_1_NACKED, TransactionStep.RECEIVING_FILE_DATA
+        )
+        self._finish_transfer_and_verify_file(file_info)
+
+    def test_duplicate_segment(self):
+        file_info = self.random_data_two_file_segments()
+        self._source_simulator_transfer_init_with_metadata(
+            checksum=ChecksumType.CRC_32,
+            file_size=file_info.file_size,
+            file_path=self.src_file_path.as_posix(),
+        )
+        first_segment = file_info.rand_data[0 : self.file_segment_len]
+        self._insert_file_segment(first_segment, 0)
+        self._insert_file_segment(first_segment, 0)
+        self._insert_file_segment(
+            file_info.rand_data[self.file_segment_len :], self.file_segment_len
+        )
+        fsm_res = self.dest_handler.state_machine()
+        self._state_checker(
+            fsm_res, CfdpStates.BUSY_CLASS_1_NACKED, TransactionStep.RECEIVING_FILE_DATA
+        )
+        self._finish_transfer_and_verify_file(file_info)
+
+    def _insert_file_segment(self, segment: bytes, offset: int):
+        fd_params = FileDataParams(file_data=segment, offset=offset)
+        file_data_pdu = FileDataPdu(params=fd_params, pdu_conf=self.src_pdu_conf)
+        self.dest_handler.insert_packet(file_data_pdu)
+
+    def _finish_transfer_and_verify_file(self, file_info: FileInfo):
+        eof_pdu = EofPdu(
+            file_size=file_info.file_size,
+            file_checksum=file_info.crc32,
+            pdu_conf=self.src_pdu_conf,
+        )
+        self.dest_handler.insert_packet(eof_pdu)
+        fsm_res = self.dest_handler.state_machine()
+        self._state_checker(fsm_res, CfdpStates.IDLE, TransactionStep.IDLE)
+        self._check_eof_recv_indication(fsm_res)
+        self._check_finished_recv_indication_success(fsm_res)
+        with open(self.dest_file_path, "rb") as rf:
+            self.assertEqual(rf.read(), file_info.rand_data)
+
     def test_permission_error(self):
         with open(self.src_file_path, "w") as of:
             of.write("Hello World\n")
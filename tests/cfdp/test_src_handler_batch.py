@@ -0,0 +1,74 @@
+import os
+import random
+import sys
+from pathlib import Path
+
+from crcmod.predefined import PredefinedCrc
+
+from spacepackets.cfdp.pdu import EofPdu, FileDataPdu, MetadataPdu
+from tmtccmd.cfdp.defs import CfdpStates
+from tmtccmd.cfdp.handler import SourceHandler
+from tmtccmd.cfdp.handler.source import TransactionStep
+from tmtccmd.cfdp.request import PutRequest
+from .test_src_handler import TestCfdpSourceHandler
+
+
+class TestCfdpSourceHandlerBatch(TestCfdpSourceHandler):
+    def setUp(self) -> None:
+        self.common_setup(False)
+
+    def _prepare_two_segment_transaction(self) -> bytes:
+        if sys.version_info >= (3, 9):
+            rand_data = random.randbytes(round(self.file_segment_len * 1.5))
+        else:
+            rand_data = os.urandom(round(self.file_segment_len * 1.5))
+        with open(self.file_path, "wb") as of:
+            of.write(rand_data)
+        put_req = PutRequest(
+            destination_id=self.dest_id,
+            source_file=self.file_path,
+            dest_file=Path("/tmp/hello_batch_copy.txt"),
+            trans_mode=None,
+            closure_requested=None,
+        )
+        self.remote_cfg.entity_id = self.dest_id
+        self.source_handler.put_request(put_req, self.remote_cfg)
+        return rand_data
+
+    def test_batch_pdu_generation(self):
+        rand_data = self._prepare_two_segment_transaction()
+        pdus = self.source_handler.state_machine_batch(10)
+        # Metadata PDU, two file data PDUs and the EOF PDU
+        self.assertEqual(len(pdus), 4)
+        self.assertIsInstance(pdus[0], MetadataPdu)
+        self.assertIsInstance(pdus[1], FileDataPdu)
+        self.assertIsInstance(pdus[2], FileDataPdu)
+        self.assertIsInstance(pdus[3], EofPdu)
+        self.assertEqual(pdus[1].offset, 0)
+        self.assertEqual(pdus[1].file_data, rand_data[0 : self.file_segment_len])
+        self.assertEqual(pdus[2].offset, self.file_segment_len)
+        self.assertEqual(pdus[2].file_data, rand_data[self.file_segment_len :])
+        # The checksum accumulated segment-wise must match a regular full file pass
+        crc32 = PredefinedCrc("crc32")
+        crc32.update(rand_data)
+        self.assertEqual(pdus[3].file_checksum, crc32.digest())
+        self.assertEqual(pdus[3].file_size, len(rand_data))
+        # All packets were confirmed internally and the transaction has finished
+        self.cfdp_user.transaction_finished_indication.assert_called_once()
+        self.assertEqual(self.source_handler.states.state, CfdpStates.IDLE)
+        self.assertEqual(self.source_handler.states.step, TransactionStep.IDLE)
+
+    def test_batch_respects_max_pdus(self):
+        self._prepare_two_segment_transaction()
+        pdus = self.source_handler.state_machine_batch(1)
+        self.assertEqual(len(pdus), 1)
+        self.assertIsInstance(pdus[0], MetadataPdu)
+        # The remaining packets can be collected with a second batch call
+        pdus = self.source_handler.state_machine_batch(10)
+        self.assertEqual(len(pdus), 3)
+        self.assertIsInstance(pdus[2], EofPdu)
+
+    def test_invalid_seq_num_width_rejected(self):
+        self.seq_num_provider.max_bit_width = 12
+        with self.assertRaises(ValueError):
+            SourceHandler(self.local_cfg, self.seq_num_provider, self.cfdp_user)
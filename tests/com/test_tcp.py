@@ -98,3 +98,39 @@ class TestTcpIf(TestCase):
     def tearDown(self) -> None:
         self.tcp_server.close()
         self.tcp_client.close()
+
+
+class TestTcpIfBoundedQueue(TestCase):
+    def setUp(self) -> None:
+        self.expected_packet_id = PacketId(
+            apid=0x22, sec_header_flag=True, ptype=PacketType.TM
+        )
+        self.tcp_client = TcpSpacePacketsComIF(
+            "tcp",
+            space_packet_ids=[self.expected_packet_id],
+            target_address=EthAddr.from_tuple((LOCALHOST, 7778)),
+            tm_polling_freqency=0.05,
+            max_packets_stored=2,
+        )
+
+    def test_bounded_tm_queue(self):
+        self.assertEqual(self.tcp_client.dropped_chunk_count, 0)
+        # Feed the internal TM queue directly, no connection required for this
+        tm_queue = self.tcp_client._TcpSpacePacketsComIF__tm_queue
+        self.assertEqual(tm_queue.maxlen, 2)
+        replies = [
+            PusTelemetry(
+                service=17, subservice=2, apid=0x22, time_provider=None
+            ).pack(),
+            PusTelemetry(
+                service=1, subservice=1, apid=0x22, time_provider=None
+            ).pack(),
+            PusTelemetry(
+                service=1, subservice=7, apid=0x22, time_provider=None
+            ).pack(),
+        ]
+        for reply in replies:
+            tm_queue.append(reply)
+        # The queue is a bounded ring buffer, the oldest chunk was dropped
+        received = self.tcp_client.receive()
+        self.assertEqual(received, replies[1:])
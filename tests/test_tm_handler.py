@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 from spacepackets.ecss import PusTelemetry
 from spacepackets.ccsds.time import CdsShortTimestamp
 from tmtccmd.tm import (
+    MAX_APID,
     SpecificApidHandlerBase,
     CcsdsTmHandler,
     GenericApidHandlerBase,
@@ -64,3 +65,13 @@ class TestTmHandler(TestCase):
         handled_packets = tm_listener.operation(com_if)
         self.assertEqual(handled_packets, 1)
         unknown_handler.handle_tm.assert_called_once()
+
+    def test_apid_range_check(self):
+        ccsds_handler = CcsdsTmHandler(None)
+        with self.assertRaises(ValueError):
+            ccsds_handler.add_apid_handler(ApidHandler(MAX_APID + 1))
+        with self.assertRaises(ValueError):
+            ccsds_handler.add_apid_handler(ApidHandler(-1))
+        # The largest valid APID is accepted
+        ccsds_handler.add_apid_handler(ApidHandler(MAX_APID))
+        self.assertTrue(ccsds_handler.has_apid(MAX_APID))
@@ -1,17 +1,89 @@
+import mmap
+import struct
+import zlib
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
-from crcmod.predefined import PredefinedCrc
-
 from spacepackets.cfdp import ChecksumType, NULL_CHECKSUM_U32
 from tmtccmd.cfdp.filestore import VirtualFilestore
 from tmtccmd.cfdp.handler.defs import ChecksumNotImplemented, SourceFileDoesNotExist
 
+try:
+    # Optional dependency which computes the Castagnoli CRC with the dedicated
+    # hardware instruction where the CPU provides one
+    import crc32c as _crc32c
+except ImportError:
+    _crc32c = None
+
+# Chunk size for the streaming read fallback of the file CRC calculation
+_CRC_STREAM_CHUNK_SIZE = 1 << 20
+
+# Maps the supported checksum types to their crcmod predefined algorithm names
+_CHECKSUM_TYPE_TO_CRCMOD_STR = {
+    ChecksumType.CRC_32: "crc32",
+    ChecksumType.CRC_32C: "crc32c",
+}
+
+
+class _ZlibCrc32:
+    """Drop-in stand-in for :py:class:`crcmod.predefined.PredefinedCrc` configured for the
+    regular CRC-32. It is backed by :py:func:`zlib.crc32`, which runs in C at memory speed
+    instead of going through the pure Python table implementation of crcmod."""
+
+    __slots__ = ["_value"]
+
+    def __init__(self):
+        self._value = 0
+
+    def update(self, data: bytes):
+        self._value = zlib.crc32(data, self._value)
+
+    def digest(self) -> bytes:
+        return struct.pack("!I", self._value)
+
+
+class _HwCrc32c:
+    """Counterpart to :py:class:`_ZlibCrc32` for the Castagnoli CRC, backed by the optional
+    crc32c package which uses the hardware CRC32 instruction on x86 and ARM."""
+
+    __slots__ = ["_value"]
+
+    def __init__(self):
+        self._value = 0
+
+    def update(self, data: bytes):
+        self._value = _crc32c.crc32c(data, self._value)
+
+    def digest(self) -> bytes:
+        return struct.pack("!I", self._value)
+
 
 class Crc32Helper:
-    def __init__(self, init_type: ChecksumType, vfs: VirtualFilestore):
+    # Maximum number of file digests kept in the per-helper cache
+    MAX_CACHED_DIGESTS = 64
+
+    def __init__(
+        self,
+        init_type: ChecksumType,
+        vfs: VirtualFilestore,
+        cache_digests: bool = False,
+    ):
+        """The digest cache is opt-in: its key relies on the file modification time,
+        which has a coarse effective granularity on real filesystems, so back-to-back
+        writes of same-sized content can go undetected. Integrity verification paths
+        must leave it disabled so they always hash the actual bytes on disk."""
         self.checksum_type = init_type
         self.vfs = vfs
+        self.cache_digests = cache_digests
+        # Digest cache keyed by file path, modification time, sizes and checksum type.
+        # Repeated transactions on an unchanged file skip the full file scan
+        self._digest_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+
+    def clear_digest_cache(self):
+        """Drop all cached file digests, e.g. if files are known to have changed without
+        their modification time reflecting it."""
+        self._digest_cache.clear()
 
     def _verify_checksum(self):
         if self.checksum_type not in [
@@ -22,36 +94,88 @@ class Crc32Helper:
             raise ChecksumNotImplemented(self.checksum_type)
 
     def checksum_type_to_crcmod_str(self) -> Optional[str]:
-        if self.checksum_type == ChecksumType.NULL_CHECKSUM:
-            return None
-        if self.checksum_type == ChecksumType.CRC_32:
-            return "crc32"
-        elif self.checksum_type == ChecksumType.CRC_32C:
-            return "crc32c"
+        return _CHECKSUM_TYPE_TO_CRCMOD_STR.get(self.checksum_type)
 
-    def generate_crc_calculator(self) -> PredefinedCrc:
+    def generate_crc_calculator(self):
+        """Returns an object with an ``update`` and ``digest`` API like
+        :py:class:`crcmod.predefined.PredefinedCrc`. The regular CRC-32 is routed through the
+        C implementation of the zlib module, the other checksums fall back to crcmod."""
         self._verify_checksum()
+        if self.checksum_type == ChecksumType.CRC_32:
+            return _ZlibCrc32()
+        if self.checksum_type == ChecksumType.CRC_32C and _crc32c is not None:
+            return _HwCrc32c()
+        # Deferred import: crcmod builds its lookup tables at import time and is only
+        # needed when neither accelerated backend covers the checksum type
+        from crcmod.predefined import PredefinedCrc
+
         return PredefinedCrc(self.checksum_type_to_crcmod_str())
 
     def calc_for_file(self, file: Path, file_sz: int, segment_len: int) -> bytes:
+        """Calculate the checksum of a file. Both the zlib and the crc32c backend release
+        the GIL while hashing larger buffers, so other threads like the TM listener keep
+        running while a large file is being scanned."""
         if self.checksum_type == ChecksumType.NULL_CHECKSUM:
             return NULL_CHECKSUM_U32
-        crc_obj = self.generate_crc_calculator()
         if segment_len == 0:
             raise ValueError("Segment length can not be 0")
-        if not file.exists():
-            raise SourceFileDoesNotExist(file)
+        if not self.cache_digests:
+            if not file.exists():
+                raise SourceFileDoesNotExist(file)
+            return self._calc_for_file(file, file_sz)
+        try:
+            stat = file.stat()
+        except FileNotFoundError:
+            raise SourceFileDoesNotExist(file) from None
+        # file_sz is part of the key: it may deliberately differ from the on-disk
+        # size and bounds how many bytes the digest covers
+        cache_key = (
+            str(file),
+            stat.st_mtime_ns,
+            stat.st_size,
+            file_sz,
+            self.checksum_type,
+        )
+        cached_digest = self._digest_cache.get(cache_key)
+        if cached_digest is not None:
+            self._digest_cache.move_to_end(cache_key)
+            return cached_digest
+        digest = self._calc_for_file(file, file_sz)
+        self._digest_cache[cache_key] = digest
+        if len(self._digest_cache) > Crc32Helper.MAX_CACHED_DIGESTS:
+            self._digest_cache.popitem(last=False)
+        return digest
+
+    def _calc_for_file(self, file: Path, file_sz: int) -> bytes:
+        crc_obj = self.generate_crc_calculator()
         current_offset = 0
         # Calculate the file CRC
         with open(file, "rb") as of:
+            mm = None
+            if file_sz > 0:
+                try:
+                    mm = mmap.mmap(of.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # Fall back to regular filestore reads, e.g. for file objects
+                    # which do not map to a real file descriptor
+                    pass
+            if mm is not None:
+                # The CRC is linear, so the mapped file can be fed to the C
+                # implementation in one call without segmenting it at the Python level.
+                # The view is bounded to the passed file size, which may be smaller
+                # than the on-disk size, so both the mmap and the streaming path
+                # checksum exactly the same number of bytes
+                with memoryview(mm) as mv:
+                    crc_obj.update(mv[:file_sz])
+                mm.close()
+                return crc_obj.digest()
+            # The chunk size is decoupled from the transfer segment length here: the
+            # digest does not depend on it and large sequential reads are a lot cheaper
+            # than segment-sized ones
+            crc_update = crc_obj.update
+            vfs_read = self.vfs.read_from_opened_file
             while current_offset < file_sz:
-                if current_offset + segment_len > file_sz:
-                    read_len = file_sz - current_offset
-                else:
-                    read_len = segment_len
-                if read_len > 0:
-                    crc_obj.update(
-                        self.vfs.read_from_opened_file(of, current_offset, read_len)
-                    )
+                read_len = min(_CRC_STREAM_CHUNK_SIZE, file_sz - current_offset)
+                crc_update(vfs_read(of, current_offset, read_len))
                 current_offset += read_len
             return crc_obj.digest()
@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from pathlib import Path
 
 from spacepackets.cfdp import Direction, ChecksumType
@@ -88,13 +87,25 @@ class BusyError(Exception):
     pass
 
 
-@dataclass
 class FileParamsBase:
-    progress: int
-    segment_len: int
-    crc32: bytes
-    no_file_data: bool
-    file_size: int
+    """Common file transfer parameters. Slotted because the fields are accessed once
+    per transferred segment on the hot path of both CFDP handlers."""
+
+    __slots__ = ["progress", "segment_len", "crc32", "no_file_data", "file_size"]
+
+    def __init__(
+        self,
+        progress: int,
+        segment_len: int,
+        crc32: bytes,
+        no_file_data: bool,
+        file_size: int,
+    ):
+        self.progress = progress
+        self.segment_len = segment_len
+        self.crc32 = crc32
+        self.no_file_data = no_file_data
+        self.file_size = file_size
 
     @classmethod
     def empty(cls):
@@ -57,9 +57,27 @@ from tmtccmd.version import get_version
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
 class _DestFileParams(FileParamsBase):
-    file_name: Path
+    __slots__ = ["file_name", "size_from_metadata"]
+
+    def __init__(
+        self,
+        progress: int,
+        segment_len: int,
+        crc32: bytes,
+        no_file_data: bool,
+        file_size: int,
+        file_name: Path,
+    ):
+        super().__init__(
+            progress=progress,
+            segment_len=segment_len,
+            crc32=crc32,
+            no_file_data=no_file_data,
+            file_size=file_size,
+        )
+        self.file_name = file_name
+        self.size_from_metadata = 0
 
     @classmethod
     def empty(cls) -> _DestFileParams:
@@ -75,9 +93,10 @@ class _DestFileParams(FileParamsBase):
     def reset(self):
         super().reset()
         self.file_name = Path()
+        self.size_from_metadata = 0
 
 
-class TransactionStep(enum.Enum):
+class TransactionStep(enum.IntEnum):
     IDLE = 0
     # Metadata was received
     TRANSACTION_START = 1
@@ -88,12 +107,17 @@ class TransactionStep(enum.Enum):
     SENDING_FINISHED_PDU = 5
 
 
-@dataclass
 class DestStateWrapper:
-    state: CfdpStates = CfdpStates.IDLE
-    transaction: TransactionStep = TransactionStep.IDLE
-    transaction_id: Optional[TransactionId] = None
-    packet_ready: bool = False
+    """Slotted because the state fields are read and written on every state machine
+    tick."""
+
+    __slots__ = ["state", "transaction", "transaction_id", "packet_ready"]
+
+    def __init__(self):
+        self.state = CfdpStates.IDLE
+        self.transaction = TransactionStep.IDLE
+        self.transaction_id: Optional[TransactionId] = None
+        self.packet_ready = False
 
 
 @dataclass
@@ -111,7 +135,7 @@ class _DestFieldWrapper:
         default_factory=lambda: _DestFileParams.empty()
     )
     file_directives_dict: Dict[
-        DirectiveType, List[AbstractFileDirectiveBase]
+        DirectiveType, Deque[AbstractFileDirectiveBase]
     ] = dataclasses.field(default_factory=lambda: dict())
     file_data_deque: Deque[FileDataPdu] = dataclasses.field(
         default_factory=lambda: deque()
@@ -167,6 +191,9 @@ class DestHandler:
         self.states = DestStateWrapper()
         self.user = user
         self.pdu_holder = PduHolder(None)
+        # Preallocated result mirroring the source handler: the members are references
+        # to long-lived handler state, so the same instance stays valid
+        self._fsm_res = FsmResult(self.states, self.pdu_holder)
         self._params = _DestFieldWrapper()
         self._crc_helper: Crc32Helper = Crc32Helper(
             ChecksumType.NULL_CHECKSUM, user.vfs
@@ -177,7 +204,7 @@ class DestHandler:
             self.__idle_fsm()
         if self.states.state == CfdpStates.BUSY_CLASS_1_NACKED:
             self.__busy_naked_fsm()
-        return FsmResult(self.states, self.pdu_holder)
+        return self._fsm_res
 
     def finish(self):
         self._params.reset()
@@ -193,14 +220,9 @@ class DestHandler:
         if packet.pdu_type == PduType.FILE_DATA:
             self._params.file_data_deque.append(cast(FileDataPdu, packet))
         else:
-            if packet.directive_type in self._params.file_directives_dict:
-                self._params.file_directives_dict.get(packet.directive_type).append(
-                    packet
-                )
-            else:
-                self._params.file_directives_dict.update(
-                    {packet.directive_type: [packet]}
-                )
+            self._params.file_directives_dict.setdefault(
+                packet.directive_type, deque()
+            ).append(packet)
 
     def confirm_packet_sent_advance_fsm(self):
         """Helper method which performs both :py:meth:`confirm_packet_sent` and
@@ -332,56 +354,99 @@ class DestHandler:
             if self._params.file_directives_dict:
                 for other_pdu in self._params.file_directives_dict:
                     _LOGGER.warning(
-                        f"Received {other_pdu} PDU without "
-                        "first receiving metadata PDU first. Discarding it"
+                        "Received %s PDU without "
+                        "first receiving metadata PDU first. Discarding it",
+                        other_pdu,
                     )
                 self._params.file_directives_dict.clear()
             if self._params.file_data_deque:
                 _LOGGER.warning(
-                    f"Received {len(self._params.file_data_deque)} file data PDUs"
-                    " without first receiving metadata PDU first. Discarding them"
+                    "Received %d file data PDUs"
+                    " without first receiving metadata PDU first. Discarding them",
+                    len(self._params.file_data_deque),
                 )
                 self._params.file_data_deque.clear()
 
+    def _fsm_receiving_file_data(self) -> bool:
+        self.__receiving_fd_pdus_nacknowledged()
+        return False
+
+    def _fsm_transfer_completion(self) -> bool:
+        self._handle_transfer_completion()
+        return False
+
+    def _fsm_sending_finished_pdu(self) -> bool:
+        self._prepare_finished_pdu()
+        self.states.packet_ready = True
+        return True
+
+    # Dispatch table for the steps of the busy state. A handler returning True ends
+    # the state machine call; otherwise the handler for the new step runs within the
+    # same call if the step advanced, mirroring the fall-through of the old if-chain
+    _STEP_HANDLERS = {
+        TransactionStep.RECEIVING_FILE_DATA: _fsm_receiving_file_data,
+        TransactionStep.TRANSFER_COMPLETION: _fsm_transfer_completion,
+        TransactionStep.SENDING_FINISHED_PDU: _fsm_sending_finished_pdu,
+    }
+
     def __busy_naked_fsm(self):
-        if self.states.transaction == TransactionStep.RECEIVING_FILE_DATA:
-            self.__receiving_fd_pdus_nacknowledged()
-        if self.states.transaction == TransactionStep.TRANSFER_COMPLETION:
-            self._handle_transfer_completion()
-        if self.states.transaction == TransactionStep.SENDING_FINISHED_PDU:
-            self._prepare_finished_pdu()
-            self.states.packet_ready = True
+        while True:
+            step = self.states.transaction
+            handler = self._STEP_HANDLERS.get(step)
+            if handler is None or handler(self):
+                return
+            if self.states.transaction is step:
+                # No progress was made, more packets are needed
+                return
 
     def __receiving_fd_pdus_nacknowledged(self):
         # TODO: Sequence count check
-        while self._params.file_data_deque:
-            next_fd = self._params.file_data_deque.popleft()
-            self.__handle_one_fd_pdu(next_fd)
+        fd_deque = self._params.file_data_deque
+        while fd_deque:
+            batch = [fd_deque.popleft()]
+            # Coalesce directly consecutive segments into one filestore write. PDUs
+            # usually arrive in order, so this collapses most per-segment write calls
+            while (
+                fd_deque
+                and fd_deque[0].offset
+                == batch[-1].offset + len(batch[-1].file_data)
+            ):
+                batch.append(fd_deque.popleft())
+            self.__handle_fd_pdu_batch(batch)
         # TODO: Support for check timer missing
         eof_pdus = self._params.file_directives_dict.get(DirectiveType.EOF_PDU)
         if eof_pdus is not None:
-            for pdu in eof_pdus:
-                eof_pdu = PduHolder(pdu).to_eof_pdu()
+            # Drain the deque while processing so an already handled EOF PDU is not
+            # processed again on the next state machine call
+            while eof_pdus:
+                eof_pdu = PduHolder(eof_pdus.popleft()).to_eof_pdu()
                 self._handle_eof_pdu(eof_pdu)
 
-    def __handle_one_fd_pdu(self, file_data_pdu: FileDataPdu):
-        data = file_data_pdu.file_data
-        offset = file_data_pdu.offset
+    def __handle_fd_pdu_batch(self, batch: List[FileDataPdu]):
+        offset = batch[0].offset
         if self.cfg.indication_cfg.file_segment_recvd_indication_required:
-            file_segment_indic_params = FileSegmentRecvdParams(
-                transaction_id=self._params.transaction_id,
-                length=len(file_data_pdu.file_data),
-                offset=offset,
-                record_cont_state=file_data_pdu.record_cont_state,
-                segment_metadata=file_data_pdu.segment_metadata,
-            )
-            self.user.file_segment_recv_indication(file_segment_indic_params)
+            # The segment indications are still generated per PDU
+            for file_data_pdu in batch:
+                file_segment_indic_params = FileSegmentRecvdParams(
+                    transaction_id=self._params.transaction_id,
+                    length=len(file_data_pdu.file_data),
+                    offset=file_data_pdu.offset,
+                    record_cont_state=file_data_pdu.record_cont_state,
+                    segment_metadata=file_data_pdu.segment_metadata,
+                )
+                self.user.file_segment_recv_indication(file_segment_indic_params)
+        if len(batch) == 1:
+            data = batch[0].file_data
+        else:
+            data = bytearray()
+            for file_data_pdu in batch:
+                data.extend(file_data_pdu.file_data)
         try:
             self.user.vfs.write_data(self._params.fp.file_name, data, offset)
             self._params.file_status = FileDeliveryStatus.FILE_RETAINED
             # Ensure that the progress value is always incremented
-            if offset + len(file_data_pdu.file_data) > self._params.fp.progress:
-                self._params.fp.progress = offset + len(file_data_pdu.file_data)
+            if offset + len(data) > self._params.fp.progress:
+                self._params.fp.progress = offset + len(data)
         except FileNotFoundError:
             if self._params.file_status != FileDeliveryStatus.FILE_RETAINED:
                 self._params.file_status = FileDeliveryStatus.DISCARDED_DELIBERATELY
@@ -1,8 +1,9 @@
 from __future__ import annotations
 import enum
 import logging
-from dataclasses import dataclass
-from typing import Optional, Dict, List
+import os
+from collections import deque
+from typing import BinaryIO, Deque, Optional, Dict, List
 
 import deprecation
 
@@ -10,12 +11,16 @@ from spacepackets.cfdp import (
     TransmissionMode,
     NULL_CHECKSUM_U32,
     ConditionCode,
+    CrcFlag,
     Direction,
+    LargeFileFlag,
     PduConfig,
     ChecksumType,
     FaultHandlerCode,
+    SegmentationControl,
 )
 from spacepackets.cfdp.pdu import (
+    GenericPduPacket,
     PduHolder,
     FileDeliveryStatus,
     DeliveryCode,
@@ -27,7 +32,13 @@ from spacepackets.cfdp.pdu import (
     AbstractFileDirectiveBase,
 )
 from spacepackets.cfdp.pdu.file_data import FileDataParams
-from spacepackets.util import UnsignedByteField, ByteFieldGenerator
+from spacepackets.util import (
+    UnsignedByteField,
+    ByteFieldEmpty,
+    ByteFieldU8,
+    ByteFieldU16,
+    ByteFieldU32,
+)
 from tmtccmd.cfdp import (
     LocalEntityCfg,
     CfdpUserBase,
@@ -55,8 +66,14 @@ from tmtccmd.version import get_version
 
 _LOGGER = logging.getLogger(__name__)
 
+# Maps the transmission mode of a put request to the busy state of the handler
+_MODE_TO_STATE = {
+    TransmissionMode.UNACKNOWLEDGED: CfdpStates.BUSY_CLASS_1_NACKED,
+    TransmissionMode.ACKNOWLEDGED: CfdpStates.BUSY_CLASS_2_ACKED,
+}
+
 
-class TransactionStep(enum.Enum):
+class TransactionStep(enum.IntEnum):
     IDLE = 0
     TRANSACTION_START = 1
     CRC_PROCEDURE = 2
@@ -69,9 +86,26 @@ class TransactionStep(enum.Enum):
     NOTICE_OF_COMPLETION = 8
 
 
-@dataclass
 class _SourceFileParams(FileParamsBase):
-    no_eof: bool = False
+    __slots__ = ["no_eof"]
+
+    def __init__(
+        self,
+        progress: int,
+        segment_len: int,
+        crc32: bytes,
+        no_file_data: bool,
+        file_size: int,
+        no_eof: bool = False,
+    ):
+        super().__init__(
+            progress=progress,
+            segment_len=segment_len,
+            crc32=crc32,
+            no_file_data=no_file_data,
+            file_size=file_size,
+        )
+        self.no_eof = no_eof
 
     @classmethod
     def empty(cls) -> _SourceFileParams:
@@ -88,19 +122,46 @@ class _SourceFileParams(FileParamsBase):
         super().reset()
 
 
-@dataclass
 class SourceStateWrapper:
-    state: CfdpStates = CfdpStates.IDLE
-    step: TransactionStep = TransactionStep.IDLE
-    packet_ready: bool = False
+    """Slotted because the state fields are read and written on every state machine
+    tick."""
+
+    __slots__ = ["state", "step", "packet_ready"]
+
+    def __init__(self):
+        self.state = CfdpStates.IDLE
+        self.step = TransactionStep.IDLE
+        self.packet_ready = False
 
 
 class TransferFieldWrapper:
+    __slots__ = [
+        "crc_helper",
+        "transaction",
+        "check_limit",
+        "crc_obj",
+        "fp",
+        "file_handle",
+        "metadata_params",
+        "remote_cfg",
+        "closure_requested",
+        "pdu_conf",
+    ]
+
     def __init__(self, local_entity_id: UnsignedByteField, vfs: VirtualFilestore):
         self.crc_helper = Crc32Helper(ChecksumType.NULL_CHECKSUM, vfs)
         self.transaction: Optional[TransactionId] = None
         self.check_limit: Optional[Countdown] = None
+        # Incremental CRC calculator fed with each sent file segment so the file is
+        # only read once for both checksumming and file data PDU generation
+        self.crc_obj = None
         self.fp = _SourceFileParams.empty()
+        # Stays open for the whole transaction so the file data PDU generation does not
+        # have to re-open the source file for every segment
+        self.file_handle: Optional[BinaryIO] = None
+        # Built once at transaction start and reused if the metadata PDU needs to be
+        # regenerated, e.g. for a retry
+        self.metadata_params: Optional[MetadataParams] = None
         self.remote_cfg: Optional[RemoteEntityCfg] = None
         self.closure_requested: bool = False
         self.pdu_conf = PduConfig.empty()
@@ -140,14 +201,35 @@ class TransferFieldWrapper:
 
     def reset(self):
         self.fp.reset()
+        self.crc_obj = None
+        if self.file_handle is not None:
+            self.file_handle.close()
+            self.file_handle = None
+        self.metadata_params = None
         self.remote_cfg = None
         self.transaction = None
         self.check_limit = None
         self.closure_requested = False
-        self.pdu_conf = PduConfig.empty()
+        self.__reset_pdu_conf_keep_source_id()
+
+    def __reset_pdu_conf_keep_source_id(self):
+        # Reset the PDU configuration fields in place instead of allocating a fresh
+        # config per transaction. This keeps references to the configuration held by
+        # other code valid and the local source entity ID, which stays the same across
+        # transactions, is retained as well
+        conf = self.pdu_conf
+        conf.dest_entity_id = ByteFieldEmpty()
+        conf.transaction_seq_num = ByteFieldEmpty()
+        conf.trans_mode = TransmissionMode.ACKNOWLEDGED
+        conf.file_flag = LargeFileFlag.NORMAL
+        conf.crc_flag = CrcFlag.NO_CRC
+        conf.direction = Direction.TOWARDS_RECEIVER
+        conf.seg_ctrl = SegmentationControl.NO_RECORD_BOUNDARIES_PRESERVATION
 
 
 class FsmResult:
+    __slots__ = ["pdu_holder", "states"]
+
     def __init__(self, pdu_holder: PduHolder, states: SourceStateWrapper):
         self.pdu_holder = pdu_holder
         self.states = states
@@ -197,9 +279,26 @@ class SourceHandler:
         self.cfg = cfg
         self.user = user
         self.seq_num_provider = seq_num_provider
+        if self.seq_num_provider.max_bit_width not in [8, 16, 32]:
+            raise ValueError(
+                "Invalid bit width for sequence number provider, must be one of [8,"
+                " 16, 32]"
+            )
+        # Validated once here so the per-transaction sequence number generation can
+        # use the matching byte field type directly without re-checking the width
+        self._seq_num_cls = {1: ByteFieldU8, 2: ByteFieldU16, 4: ByteFieldU32}[
+            self.seq_num_provider.max_bit_width // 8
+        ]
         self._params = TransferFieldWrapper(cfg.local_entity_id, self.user.vfs)
+        # Both FSM result members are references to long-lived handler state, so one
+        # preallocated instance always reflects the current state and can be handed
+        # out on every state machine call instead of allocating a fresh result
+        self._fsm_res = FsmResult(self.pdu_holder, self.states)
+        # Bound method cache: the filestore read is called once per file segment and
+        # the repeated attribute chain lookup adds up on large transfers
+        self._vfs_read = self.user.vfs.read_from_opened_file
         self._put_req: Optional[PutRequest] = None
-        self._rec_dict: Dict[DirectiveType, List[AbstractFileDirectiveBase]] = dict()
+        self._rec_dict: Dict[DirectiveType, Deque[AbstractFileDirectiveBase]] = dict()
 
     @property
     def transaction_seq_num(self) -> UnsignedByteField:
@@ -219,7 +318,7 @@ class SourceHandler:
         self._params.source_id = source_id
 
     def put_request(self, request: PutRequest, remote_cfg: RemoteEntityCfg):
-        if self.states.state != CfdpStates.IDLE:
+        if self.states.state is not CfdpStates.IDLE:
             _LOGGER.debug("CFDP source handler is busy, can't process put request")
             return False
         self._put_req = request
@@ -227,16 +326,16 @@ class SourceHandler:
         self._params.dest_id = remote_cfg.entity_id
         self.states.packet_ready = False
         self._setup_transmission_mode()
-        if self._params.transmission_mode == TransmissionMode.UNACKNOWLEDGED:
-            _LOGGER.debug("Starting Put Request handling in NAK mode")
-            self.states.state = CfdpStates.BUSY_CLASS_1_NACKED
-        elif self._params.transmission_mode == TransmissionMode.ACKNOWLEDGED:
-            _LOGGER.debug("Starting Put Request handling in ACK mode")
-            self.states.state = CfdpStates.BUSY_CLASS_2_ACKED
-        else:
+        state = _MODE_TO_STATE.get(self._params.transmission_mode)
+        if state is None:
             raise ValueError(
                 f"Invalid transmission mode {self._params.transmission_mode} passed"
             )
+        _LOGGER.debug(
+            "Starting Put Request handling in %s mode",
+            self._params.transmission_mode,
+        )
+        self.states.state = state
         return True
 
     @deprecation.deprecated(
@@ -273,67 +372,97 @@ class SourceHandler:
             DirectiveType.EOF_PDU,
         ]:
             raise InvalidPduForSourceHandler(packet)
-        # A dictionary is used to allow passing multiple received packets and store them until
-        # they are processed by the state machine.
-        if packet.directive_type in self._rec_dict:
-            pdu_directive_list = self._rec_dict.get(packet.directive_type)
-            pdu_directive_list.append(packet)
-        else:
-            self._rec_dict.update({packet.directive_type: [packet]})
-
-    def __fsm_crc_procedure(self):
-        if self._params.fp.file_size == 0:
-            # Empty file, use null checksum
+        # A dictionary of deques is used to allow passing multiple received packets and
+        # store them until they are consumed by the state machine.
+        self._rec_dict.setdefault(packet.directive_type, deque()).append(packet)
+
+    def _fsm_idle(self) -> Optional[FsmResult]:
+        self.states.step = TransactionStep.TRANSACTION_START
+        return None
+
+    def _fsm_transaction_start(self) -> Optional[FsmResult]:
+        self._transaction_start()
+        self.states.step = TransactionStep.CRC_PROCEDURE
+        return None
+
+    def _fsm_crc_procedure(self) -> Optional[FsmResult]:
+        if (
+            self._params.fp.file_size == 0
+            or self._params.crc_helper.checksum_type == ChecksumType.NULL_CHECKSUM
+        ):
+            # Empty file or no checksum requested, use null checksum
             self._params.fp.crc32 = NULL_CHECKSUM_U32
         else:
-            self._params.fp.crc32 = self._params.crc_helper.calc_for_file(
-                file=self._put_req.source_file,
-                file_sz=self._params.fp.file_size,
-                segment_len=self._params.fp.segment_len,
-            )
-
+            # The checksum is accumulated while the file data PDUs are generated
+            # instead of reading the whole file once up-front only for the CRC
+            self._params.crc_obj = self._params.crc_helper.generate_crc_calculator()
         self.states.step = TransactionStep.SENDING_METADATA
+        return None
 
-    def __fsm_naked(  # noqa: C901  # complexity is okay here
-        self,
-    ) -> Optional[FsmResult]:
-        if self._put_req is None:
-            return FsmResult(self.pdu_holder, self.states)
-        if self.states.step == TransactionStep.IDLE:
-            self.states.step = TransactionStep.TRANSACTION_START
-        if self.states.step == TransactionStep.TRANSACTION_START:
-            self._transaction_start()
-            self.states.step = TransactionStep.CRC_PROCEDURE
-        if self.states.step == TransactionStep.CRC_PROCEDURE:
-            self.__fsm_crc_procedure()
-        if self.states.step == TransactionStep.SENDING_METADATA:
-            self._prepare_metadata_pdu()
+    def _fsm_sending_metadata(self) -> Optional[FsmResult]:
+        self._prepare_metadata_pdu()
+        self.states.packet_ready = True
+        return self._fsm_res
+
+    def _fsm_sending_file_data(self) -> Optional[FsmResult]:
+        if self._prepare_next_file_data_pdu():
             self.states.packet_ready = True
-            return FsmResult(self.pdu_holder, self.states)
-        if self.states.step == TransactionStep.SENDING_FILE_DATA:
-            if self._prepare_next_file_data_pdu():
-                self.states.packet_ready = True
-                return FsmResult(self.pdu_holder, self.states)
+            return self._fsm_res
+        if self._params.fp.no_eof:
+            # Special case: Metadata Only.
+            if self._params.closure_requested:
+                self.states.step = TransactionStep.WAIT_FOR_FINISH
             else:
-                if self._params.fp.no_eof:
-                    # Special case: Metadata Only.
-                    if self._params.closure_requested:
-                        self.states.step = TransactionStep.WAIT_FOR_FINISH
-                    else:
-                        self.states.step = TransactionStep.NOTICE_OF_COMPLETION
-                else:
-                    # Special case: Empty file.
-                    self.states.step = TransactionStep.SENDING_EOF
-        if self.states.step == TransactionStep.SENDING_EOF:
-            self._prepare_eof_pdu()
-            self.states.packet_ready = True
-            return FsmResult(self.pdu_holder, self.states)
-        if self.states.step == TransactionStep.WAIT_FOR_ACK:
-            self._handle_wait_for_ack()
-        if self.states.step == TransactionStep.WAIT_FOR_FINISH:
-            self._handle_wait_for_finish()
-        if self.states.step == TransactionStep.NOTICE_OF_COMPLETION:
-            self._notice_of_completion()
+                self.states.step = TransactionStep.NOTICE_OF_COMPLETION
+        else:
+            # Special case: Empty file.
+            self.states.step = TransactionStep.SENDING_EOF
+        return None
+
+    def _fsm_sending_eof(self) -> Optional[FsmResult]:
+        self._prepare_eof_pdu()
+        self.states.packet_ready = True
+        return self._fsm_res
+
+    def _fsm_wait_for_ack(self) -> Optional[FsmResult]:
+        self._handle_wait_for_ack()
+        if self.states.step is TransactionStep.WAIT_FOR_ACK:
+            return self._fsm_res
+        return None
+
+    def _fsm_wait_for_finish(self) -> Optional[FsmResult]:
+        self._handle_wait_for_finish()
+        if self.states.step is TransactionStep.WAIT_FOR_FINISH:
+            return self._fsm_res
+        return None
+
+    def _fsm_notice_of_completion(self) -> Optional[FsmResult]:
+        self._notice_of_completion()
+        return self._fsm_res
+
+    # Dispatch table for the state machine steps. Each handler either returns the FSM
+    # result to the caller or returns None, in which case the handler for the (possibly
+    # updated) current step runs within the same state machine call. This keeps the
+    # fall-through semantics of the former if-chain with a single dict lookup per step.
+    _STEP_HANDLERS = {
+        TransactionStep.IDLE: _fsm_idle,
+        TransactionStep.TRANSACTION_START: _fsm_transaction_start,
+        TransactionStep.CRC_PROCEDURE: _fsm_crc_procedure,
+        TransactionStep.SENDING_METADATA: _fsm_sending_metadata,
+        TransactionStep.SENDING_FILE_DATA: _fsm_sending_file_data,
+        TransactionStep.SENDING_EOF: _fsm_sending_eof,
+        TransactionStep.WAIT_FOR_ACK: _fsm_wait_for_ack,
+        TransactionStep.WAIT_FOR_FINISH: _fsm_wait_for_finish,
+        TransactionStep.NOTICE_OF_COMPLETION: _fsm_notice_of_completion,
+    }
+
+    def __fsm_naked(self) -> Optional[FsmResult]:
+        if self._put_req is None:
+            return self._fsm_res
+        while True:
+            fsm_res = self._STEP_HANDLERS[self.states.step](self)
+            if fsm_res is not None:
+                return fsm_res
 
     def state_machine(self) -> FsmResult:
         """This is the primary state machine which performs the CFDP procedures like CRC calculation
@@ -353,13 +482,32 @@ class SourceHandler:
         :raises SourceFileDoesNotExist: The source file for which a transaction was requested
             does not exist.
         """
-        if self.states.state == CfdpStates.IDLE:
-            return FsmResult(self.pdu_holder, self.states)
-        elif self.states.state == CfdpStates.BUSY_CLASS_1_NACKED:
+        if self.states.state is CfdpStates.IDLE:
+            return self._fsm_res
+        elif self.states.state is CfdpStates.BUSY_CLASS_1_NACKED:
             fsm_res = self.__fsm_naked()
             if fsm_res is not None:
                 return fsm_res
-        return FsmResult(self.pdu_holder, self.states)
+        return self._fsm_res
+
+    def state_machine_batch(self, max_pdus: int) -> List[GenericPduPacket]:
+        """Run the state machine repeatedly and collect up to ``max_pdus`` generated packets.
+
+        This amortizes the per-call overhead of :py:meth:`state_machine` across multiple
+        packets, which matters for large files transferred with small segment lengths.
+        The packet send is confirmed internally for each collected packet, so the caller
+        takes over the responsibility to send all returned packets in order. The batch
+        ends early when the state machine does not generate another packet, e.g. because
+        the transaction is finished or an acknowledgement is expected first.
+        """
+        pdus: List[GenericPduPacket] = []
+        while len(pdus) < max_pdus:
+            fsm_res = self.state_machine()
+            if not fsm_res.states.packet_ready:
+                break
+            pdus.append(fsm_res.pdu_holder.base)
+            self.confirm_packet_sent_advance_fsm()
+        return pdus
 
     def confirm_packet_sent_advance_fsm(self):
         """Helper method which performs both :py:meth:`confirm_packet_sent` and
@@ -385,12 +533,12 @@ class SourceHandler:
                 f"Must send current packet {self.pdu_holder.base} before "
                 "advancing state machine"
             )
-        if self.states.state == CfdpStates.BUSY_CLASS_1_NACKED:
-            if self.states.step == TransactionStep.SENDING_METADATA:
+        if self.states.state is CfdpStates.BUSY_CLASS_1_NACKED:
+            if self.states.step is TransactionStep.SENDING_METADATA:
                 self.states.step = TransactionStep.SENDING_FILE_DATA
-            elif self.states.step == TransactionStep.SENDING_FILE_DATA:
+            elif self.states.step is TransactionStep.SENDING_FILE_DATA:
                 self._handle_file_data_sent()
-            elif self.states.step == TransactionStep.SENDING_EOF:
+            elif self.states.step is TransactionStep.SENDING_EOF:
                 self._handle_eof_sent()
 
     def reset(self):
@@ -401,7 +549,7 @@ class SourceHandler:
     def _handle_eof_sent(self):
         if self.cfg.indication_cfg.eof_sent_indication_required:
             self.user.eof_sent_indication(self._params.transaction)
-        if self.states.state == CfdpStates.BUSY_CLASS_1_NACKED:
+        if self.states.state is CfdpStates.BUSY_CLASS_1_NACKED:
             if self._params.closure_requested:
                 if self._params.remote_cfg.check_limit is not None:
                     self._params.check_limit = (
@@ -422,13 +570,13 @@ class SourceHandler:
             self.states.step = TransactionStep.SENDING_EOF
 
     def _handle_wait_for_ack(self):
-        if self.states.state != CfdpStates.BUSY_CLASS_2_ACKED:
+        if self.states.state is not CfdpStates.BUSY_CLASS_2_ACKED:
             _LOGGER.error(
                 f"Invalid ACK waiting function call for state {self.states.state}"
             )
         pdu_list = self._rec_dict.get(DirectiveType.ACK_PDU)
         if pdu_list is None:
-            return FsmResult(self.pdu_holder, self.states)
+            return self._fsm_res
         for pdu in pdu_list:
             holder = PduHolder(pdu)
             ack_pdu = holder.to_ack_pdu()
@@ -469,34 +617,31 @@ class SourceHandler:
                     _LOGGER.warning(
                         f"Check limit countdown: {self._params.check_limit}"
                     )
-            # Check all entries for some robustness against out-of-order reception
-            if DirectiveType.FINISHED_PDU in self._rec_dict:
-                pdu_list = self._rec_dict.get(DirectiveType.FINISHED_PDU)
-                for pdu in pdu_list:
-                    holder = PduHolder(pdu)
-                    finish_pdu = holder.to_finished_pdu()
-                    if (
-                        finish_pdu.transaction_seq_num
-                        != self._params.transaction_seq_num
-                    ):
-                        # Ignore packet not related to current transfer. Still yield a warning,
-                        # because ideally those packets are not passed.
-                        _LOGGER.warning(
-                            "Received Finished PDU with sequence number"
-                            f" {finish_pdu.transaction_seq_num} not related to current"
-                            f" transfer {self._params.transaction_seq_num}"
-                        )
-                        return
-                    # TODO: I think there are some more conditions where we can issue a notice
-                    #       of completion
-                    if finish_pdu.condition_code == ConditionCode.NO_ERROR:
-                        self.states.step = TransactionStep.NOTICE_OF_COMPLETION
-                    else:
-                        # TODO: Implement error handling
-                        _LOGGER.warning(
-                            f"Received condition code {finish_pdu.condition_code} in "
-                            "Finished PDU"
-                        )
+            # Drain all queued entries for some robustness against out-of-order
+            # reception. Consumed packets are popped from the deque so they are not
+            # re-examined and re-wrapped on every state machine call
+            finished_pdus = self._rec_dict.get(DirectiveType.FINISHED_PDU)
+            while finished_pdus:
+                finish_pdu = PduHolder(finished_pdus.popleft()).to_finished_pdu()
+                if finish_pdu.transaction_seq_num != self._params.transaction_seq_num:
+                    # Ignore packet not related to current transfer. Still yield a warning,
+                    # because ideally those packets are not passed.
+                    _LOGGER.warning(
+                        "Received Finished PDU with sequence number"
+                        f" {finish_pdu.transaction_seq_num} not related to current"
+                        f" transfer {self._params.transaction_seq_num}"
+                    )
+                    continue
+                # TODO: I think there are some more conditions where we can issue a notice
+                #       of completion
+                if finish_pdu.condition_code == ConditionCode.NO_ERROR:
+                    self.states.step = TransactionStep.NOTICE_OF_COMPLETION
+                else:
+                    # TODO: Implement error handling
+                    _LOGGER.warning(
+                        f"Received condition code {finish_pdu.condition_code} in "
+                        "Finished PDU"
+                    )
 
     def _setup_transmission_mode(self):
         # Transmission mode settings in the put request override settings from the remote MIB
@@ -513,19 +658,40 @@ class SourceHandler:
         self._params.closure_requested = closure_req_to_set
 
     def _transaction_start(self):
+        fp = self._params.fp
         if self._put_req.metadata_only:
-            self._params.fp.no_file_data = True
-            self._params.fp.no_eof = True
+            fp.no_file_data = True
+            fp.no_eof = True
         else:
-            if not self._put_req.source_file.exists():
+            try:
+                # A single stat call provides both the existence check and the file size
+                size = self._put_req.source_file.stat().st_size
+            except FileNotFoundError:
                 # TODO: Handle this exception in the handler, reset CFDP state machine
-                raise SourceFileDoesNotExist(self._put_req.source_file)
-            size = self._put_req.source_file.stat().st_size
+                raise SourceFileDoesNotExist(self._put_req.source_file) from None
             if size == 0:
-                self._params.fp.no_file_data = True
+                fp.no_file_data = True
             else:
-                self._params.fp.file_size = size
-        self._params.fp.segment_len = self._params.remote_cfg.max_file_segment_len
+                fp.file_size = size
+                self._params.file_handle = open(self._put_req.source_file, "rb")
+                if hasattr(os, "posix_fadvise"):
+                    # The file is read strictly sequentially for the file data PDUs,
+                    # so let the kernel use a larger readahead window
+                    os.posix_fadvise(
+                        self._params.file_handle.fileno(),
+                        0,
+                        0,
+                        os.POSIX_FADV_SEQUENTIAL,
+                    )
+        fp.segment_len = self._params.remote_cfg.max_file_segment_len
+        if not self._put_req.metadata_only:
+            # These PDU configuration fields stay the same for the whole transaction,
+            # so they are written once here instead of once per generated PDU
+            self._params.pdu_conf.seg_ctrl = self._put_req.seg_ctrl
+            self._params.pdu_conf.dest_entity_id = self._put_req.destination_id
+            self._params.pdu_conf.crc_flag = self._params.remote_cfg.crc_on_transmission
+            self._params.pdu_conf.direction = Direction.TOWARDS_RECEIVER
+        self._params.metadata_params = self._build_metadata_params()
         self._get_next_transfer_seq_num()
         self._params.transaction = TransactionId(
             source_entity_id=self.cfg.local_entity_id,
@@ -533,32 +699,32 @@ class SourceHandler:
         )
         self.user.transaction_indication(self._params.transaction)
 
-    def _prepare_metadata_pdu(self):
-        if self.states.packet_ready:
-            raise PacketSendNotConfirmed(
-                f"Must send current packet {self.pdu_holder.base} first"
-            )
-        options = []
+    def _build_metadata_params(self) -> MetadataParams:
         if self._put_req.metadata_only:
-            params = MetadataParams(
+            return MetadataParams(
                 closure_requested=self._params.closure_requested,
                 checksum_type=self._params.crc_helper.checksum_type,
                 file_size=0,
                 dest_file_name=None,
                 source_file_name=None,
             )
-        else:
-            self._params.pdu_conf.seg_ctrl = self._put_req.seg_ctrl
-            self._params.pdu_conf.dest_entity_id = self._put_req.destination_id
-            self._params.pdu_conf.crc_flag = self._params.remote_cfg.crc_on_transmission
-            self._params.pdu_conf.direction = Direction.TOWARDS_RECEIVER
-            params = MetadataParams(
-                dest_file_name=self._put_req.dest_file.as_posix(),
-                source_file_name=self._put_req.source_file.as_posix(),
-                checksum_type=self._params.crc_helper.checksum_type,
-                closure_requested=self._params.closure_requested,
-                file_size=self._params.fp.file_size,
+        return MetadataParams(
+            dest_file_name=self._put_req.dest_file.as_posix(),
+            source_file_name=self._put_req.source_file.as_posix(),
+            checksum_type=self._params.crc_helper.checksum_type,
+            closure_requested=self._params.closure_requested,
+            file_size=self._params.fp.file_size,
+        )
+
+    def _prepare_metadata_pdu(self):
+        if self.states.packet_ready:
+            raise PacketSendNotConfirmed(
+                f"Must send current packet {self.pdu_holder.base} first"
             )
+        options = []
+        params = self._params.metadata_params
+        if params is None:
+            params = self._params.metadata_params = self._build_metadata_params()
         if self._put_req.fs_requests is not None:
             for fs_request in self._put_req.fs_requests:
                 options.append(fs_request)
@@ -580,44 +746,42 @@ class SourceHandler:
         :return: True if a packet was prepared, False if PDU handling is done and the next steps
             in the Copy File procedure can be performed
         """
+        # Localize the file parameters: this method runs once per segment and the
+        # attribute chain through the wrapper is paid repeatedly otherwise
+        fp = self._params.fp
         # No need to send a file data PDU for an empty file
-        if self._params.fp.no_file_data:
+        if fp.no_file_data:
             return False
-        with open(self._put_req.source_file, "rb") as of:
-            if self._params.fp.progress == self._params.fp.file_size:
-                return False
-            if self.states.packet_ready:
-                raise PacketSendNotConfirmed(
-                    f"Must send current packet {self.pdu_holder.base} first"
-                )
-            if self._params.fp.file_size < self._params.fp.segment_len:
-                read_len = self._params.fp.file_size
-            else:
-                if (
-                    self._params.fp.progress + self._params.fp.segment_len
-                    > self._params.fp.file_size
-                ):
-                    read_len = self._params.fp.file_size - self._params.fp.progress
-                else:
-                    read_len = self._params.fp.segment_len
-            file_data = self.user.vfs.read_from_opened_file(
-                of, self._params.fp.progress, read_len
-            )
-            # TODO: Support for record continuation state not implemented yet. Segment metadata
-            #       flag is therefore always set to False. Segment metadata support also omitted
-            #       for now. Implementing those generically could be done in form of a callback,
-            #       e.g. abstractmethod of this handler as a first way, another one being
-            #       to expect the user to supply some helper class to split up a file
-            fd_params = FileDataParams(
-                file_data=file_data,
-                offset=self._params.fp.progress,
-                segment_metadata_flag=False,
-            )
-            file_data_pdu = FileDataPdu(
-                pdu_conf=self._params.pdu_conf, params=fd_params
+        if fp.progress == fp.file_size:
+            return False
+        if self.states.packet_ready:
+            raise PacketSendNotConfirmed(
+                f"Must send current packet {self.pdu_holder.base} first"
             )
-            self._params.fp.progress += read_len
-            self.pdu_holder.base = file_data_pdu
+        of = self._params.file_handle
+        if of is None:
+            # The file handle is usually opened at transaction start already
+            of = self._params.file_handle = open(self._put_req.source_file, "rb")
+        read_len = min(fp.segment_len, fp.file_size - fp.progress)
+        file_data = self._vfs_read(of, fp.progress, read_len)
+        # TODO: Support for record continuation state not implemented yet. Segment metadata
+        #       flag is therefore always set to False. Segment metadata support also omitted
+        #       for now. Implementing those generically could be done in form of a callback,
+        #       e.g. abstractmethod of this handler as a first way, another one being
+        #       to expect the user to supply some helper class to split up a file
+        fd_params = FileDataParams(
+            file_data=file_data,
+            offset=fp.progress,
+            segment_metadata_flag=False,
+        )
+        file_data_pdu = FileDataPdu(pdu_conf=self._params.pdu_conf, params=fd_params)
+        fp.progress += read_len
+        crc_obj = self._params.crc_obj
+        if crc_obj is not None:
+            crc_obj.update(file_data)
+            if fp.progress == fp.file_size:
+                fp.crc32 = crc_obj.digest()
+        self.pdu_holder.base = file_data_pdu
         return True
 
     def _prepare_eof_pdu(self):
@@ -633,14 +797,7 @@ class SourceHandler:
 
     def _get_next_transfer_seq_num(self):
         next_seq_num = self.seq_num_provider.get_and_increment()
-        if self.seq_num_provider.max_bit_width not in [8, 16, 32]:
-            raise ValueError(
-                "Invalid bit width for sequence number provider, must be one of [8,"
-                " 16, 32]"
-            )
-        self._params.pdu_conf.transaction_seq_num = ByteFieldGenerator.from_int(
-            self.seq_num_provider.max_bit_width // 8, next_seq_num
-        )
+        self._params.pdu_conf.transaction_seq_num = self._seq_num_cls(next_seq_num)
 
     def _declare_fault(self, cond: ConditionCode):
         _LOGGER.warning(
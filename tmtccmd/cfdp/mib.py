@@ -136,20 +136,24 @@ class RemoteEntityCfg:
 
 
 class RemoteEntityCfgTable:
+    """Keyed by the integer value of the entity ID internally: integers hash a lot
+    cheaper than byte field objects and the lookup becomes independent of the byte
+    field width used by the caller."""
+
     def __init__(self):
         self._remote_entity_dict = dict()
 
     def add_config(self, cfg: RemoteEntityCfg) -> bool:
-        if cfg.entity_id in self._remote_entity_dict:
+        if cfg.entity_id.value in self._remote_entity_dict:
             return False
-        self._remote_entity_dict.update({cfg.entity_id: cfg})
+        self._remote_entity_dict[cfg.entity_id.value] = cfg
         return True
 
     def add_configs(self, cfgs: Sequence[RemoteEntityCfg]):
         for cfg in cfgs:
-            if cfg.entity_id in self._remote_entity_dict:
+            if cfg.entity_id.value in self._remote_entity_dict:
                 continue
-            self._remote_entity_dict.update({cfg.entity_id: cfg})
+            self._remote_entity_dict[cfg.entity_id.value] = cfg
 
     def get_cfg(self, remote_entity_id: UnsignedByteField) -> RemoteEntityCfg:
-        return self._remote_entity_dict.get(remote_entity_id)
+        return self._remote_entity_dict.get(remote_entity_id.value)
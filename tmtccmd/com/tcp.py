@@ -1,13 +1,11 @@
 """TCP communication interface"""
 import logging
-import queue
 import socket
-import time
 import enum
 import threading
-import select
+import selectors
 from collections import deque
-from typing import Optional, Sequence
+from typing import Deque, List, Optional, Sequence
 
 from spacepackets.ccsds.spacepacket import parse_space_packets, PacketId
 
@@ -56,15 +54,20 @@ class TcpSpacePacketsComIF(ComInterface):
         self.connected = False
 
         self.__tcp_socket: Optional[socket.socket] = None
-        self.__last_connection_time = 0
+        # Uses epoll on Linux, which scales better than select and avoids rebuilding
+        # the watched file descriptor set on every polling call
+        self.__selector: Optional[selectors.BaseSelector] = None
         self.__tm_thread_kill_signal = threading.Event()
         # Separate thread to request TM packets periodically if no TCs are being sent
         self.__tcp_conn_thread: Optional[threading.Thread] = threading.Thread(
             target=self.__tcp_tm_client, daemon=True
         )
-        self.__tm_queue = queue.Queue()
-        self.__analysis_queue = deque()
-        self.tm_packet_list = []
+        # Bounded ring buffer: if the maximum number of stored packets is specified,
+        # the oldest packets are discarded automatically when the queue is full
+        self.__tm_queue: Deque[bytes] = deque(maxlen=max_packets_stored)
+        self.__dropped_chunks = 0
+        self.__analysis_queue: Deque[bytes] = deque()
+        self.tm_packet_list: List[bytes] = []
 
     @property
     def id(self) -> str:
@@ -95,10 +98,16 @@ class TcpSpacePacketsComIF(ComInterface):
     def set_up_socket(self):
         if self.__tcp_socket is None:
             self.__tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Disable Nagle's algorithm: small telecommands should go out immediately
+            # instead of being buffered for up to the delayed-ACK timeout
+            self.__tcp_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.__tcp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             try:
                 self.__tcp_socket.settimeout(2.0)
                 self.__tcp_socket.connect(self.target_address.to_tuple)
                 self.connected = True
+                self.__selector = selectors.DefaultSelector()
+                self.__selector.register(self.__tcp_socket, selectors.EVENT_READ)
             except socket.timeout as e:
                 _LOGGER.warning(
                     "Could not connect to socket with address"
@@ -128,6 +137,7 @@ class TcpSpacePacketsComIF(ComInterface):
                     )
                 self.__tcp_socket.close()
                 socket_was_closed = True
+        self.__close_selector()
         if self.__tcp_socket is not None and not socket_was_closed:
             self.__tcp_socket.close()
         self.__tcp_socket = None
@@ -137,11 +147,14 @@ class TcpSpacePacketsComIF(ComInterface):
         try:
             if not self.connected:
                 self.set_up_socket()
-            self.__tcp_socket.sendto(data, self.target_address.to_tuple)
+            self.__tcp_socket.sendall(data)
         except BrokenPipeError as e:
             raise SendError(f"{e}", e)
-        except ConnectionRefusedError or OSError as e:
+        except (ConnectionRefusedError, OSError) as e:
             self.connected = False
+            # Unregister and close the selector as well, otherwise every reconnect
+            # cycle would leak the selector file descriptor of the old socket
+            self.__close_selector()
             self.__tcp_socket.close()
             self.__tcp_socket = None
             raise SendError(f"TCP connection attempt failed with exception: {e}", e)
@@ -152,9 +165,19 @@ class TcpSpacePacketsComIF(ComInterface):
         self.tm_packet_list = []
         return tm_packet_list
 
+    @property
+    def dropped_chunk_count(self) -> int:
+        """Number of received chunks which were discarded because the TM queue was full."""
+        return self.__dropped_chunks
+
     def __tm_queue_to_packet_list(self):
-        while self.__tm_queue.qsize() > 0:
-            self.__analysis_queue.append(self.__tm_queue.get())
+        # Drain element-wise: each popleft is atomic, so chunks appended by the
+        # receiver thread during the drain are either moved in this pass or stay
+        # queued for the next one, without ever being lost
+        tm_queue = self.__tm_queue
+        analysis_queue = self.__analysis_queue
+        while tm_queue:
+            analysis_queue.append(tm_queue.popleft())
         # TCP is stream based, so there might be broken packets or multiple packets in one recv
         # call. We parse the space packets contained in the stream here
         if self.com_type == TcpCommunicationType.SPACE_PACKETS:
@@ -169,20 +192,24 @@ class TcpSpacePacketsComIF(ComInterface):
                 self.tm_packet_list.append(self.__analysis_queue.popleft())
 
     def __tcp_tm_client(self):
-        while True and not self.__tm_thread_kill_signal.is_set():
+        while not self.__tm_thread_kill_signal.is_set():
             if self.connected:
                 try:
                     self.__receive_tm_packets()
+                    continue
                 except ConnectionRefusedError:
                     _LOGGER.warning("TCP connection attempt failed..")
-            time.sleep(self.tm_polling_frequency)
+            # Waiting on the kill event instead of sleeping allows the thread to shut
+            # down immediately when the interface is closed
+            self.__tm_thread_kill_signal.wait(self.tm_polling_frequency)
 
     def __receive_tm_packets(self):
         try:
-            while True:
-                ready = select.select([self.__tcp_socket], [], [], 0)
-                if not ready[0]:
-                    break
+            # Block until data has arrived instead of polling on a timer. A single wake-up
+            # can then drain multiple TCP segments at once. The timeout bounds the reaction
+            # time to the kill signal.
+            ready = self.__selector.select(self.tm_polling_frequency)
+            while ready:
                 bytes_recvd = self.__tcp_socket.recv(4096)
                 if bytes_recvd == b"":
                     self.__close_tcp_socket()
@@ -192,17 +219,20 @@ class TcpSpacePacketsComIF(ComInterface):
                     self.connected = True
                 if (
                     self.max_packets_stored is not None
-                    and self.__tm_queue.qsize() >= self.max_packets_stored
+                    and len(self.__tm_queue) >= self.max_packets_stored
                 ):
                     _LOGGER.warning(
                         "Number of packets in TCP queue too large. "
                         "Overwriting old packets.."
                     )
-                    self.__tm_queue.get()
+                    self.__dropped_chunks += 1
                     # TODO: If segments are received but the receiver is unable to parse packets
                     #       properly, it might make sense to have a timeout which then also
                     #       logs that there might be an issue reading packets
-                self.__tm_queue.put(bytes(bytes_recvd))
+                # recv already returns an immutable bytes object, so it can be stored
+                # directly without copying it again
+                self.__tm_queue.append(bytes_recvd)
+                ready = self.__selector.select(0)
         except ConnectionResetError:
             self.__close_tcp_socket()
             _LOGGER.exception("ConnectionResetError. TCP server might not be up")
@@ -213,5 +243,17 @@ class TcpSpacePacketsComIF(ComInterface):
 
     def __close_tcp_socket(self):
         self.connected = False
+        self.__close_selector()
         self.__tcp_socket.close()
         self.__tcp_socket = None
+
+    def __close_selector(self):
+        if self.__selector is not None:
+            if self.__tcp_socket is not None:
+                try:
+                    self.__selector.unregister(self.__tcp_socket)
+                except (KeyError, ValueError):
+                    # Socket was not registered or is already closed
+                    pass
+            self.__selector.close()
+            self.__selector = None
@@ -18,12 +18,27 @@ from tmtccmd.com.serial_fixed_frame import SerialFixedFrameComIF
 from tmtccmd.com.serial_cobs import SerialCobsComIF
 
 from tmtccmd.com.ser_utils import determine_com_port, determine_baud_rate
-from tmtccmd.com.tcpip_utils import TcpIpType, EthAddr
+from tmtccmd.com.tcpip_utils import (
+    TcpIpType,
+    EthAddr,
+    determine_udp_send_address,
+    determine_tcp_send_address,
+)
 from tmtccmd.com.udp import UdpComIF
 from tmtccmd.com.tcp import TcpSpacePacketsComIF
 
 _LOGGER = logging.getLogger(__name__)
 
+# The COM interface keys are compared and dispatched on repeatedly, so the enum
+# values are cached once at module scope
+_CIF_DUMMY = CoreComInterfaces.DUMMY.value
+_CIF_UDP = CoreComInterfaces.UDP.value
+_CIF_TCP = CoreComInterfaces.TCP.value
+_CIF_SER_DLE = CoreComInterfaces.SERIAL_DLE.value
+_CIF_SER_FIXED = CoreComInterfaces.SERIAL_FIXED_FRAME.value
+_CIF_SER_COBS = CoreComInterfaces.SERIAL_COBS.value
+_CIF_SER_QEMU = CoreComInterfaces.SERIAL_QEMU.value
+
 
 class ComCfgBase:
     def __init__(
@@ -61,16 +76,16 @@ class SerialCfgWrapper(ComCfgBase):
 def create_com_interface_cfg_default(
     com_if_key: str, json_cfg_path: str, space_packet_ids: Optional[Sequence[PacketId]]
 ) -> Optional[ComCfgBase]:
-    if com_if_key == CoreComInterfaces.DUMMY.value:
+    if com_if_key == _CIF_DUMMY:
         return ComCfgBase(com_if_key=com_if_key, json_cfg_path=json_cfg_path)
-    elif com_if_key == CoreComInterfaces.UDP.value:
+    elif com_if_key == _CIF_UDP:
         return default_tcpip_cfg_setup(
             com_if_key=com_if_key,
             json_cfg_path=json_cfg_path,
             tcpip_type=TcpIpType.UDP,
             space_packet_ids=space_packet_ids,
         )
-    elif com_if_key == CoreComInterfaces.TCP.value:
+    elif com_if_key == _CIF_TCP:
         assert space_packet_ids is not None
         return default_tcpip_cfg_setup(
             com_if_key=com_if_key,
@@ -79,9 +94,9 @@ def create_com_interface_cfg_default(
             space_packet_ids=space_packet_ids,
         )
     elif com_if_key in [
-        CoreComInterfaces.SERIAL_DLE.value,
-        CoreComInterfaces.SERIAL_FIXED_FRAME.value,
-        CoreComInterfaces.SERIAL_COBS.value,
+        _CIF_SER_DLE,
+        _CIF_SER_FIXED,
+        _CIF_SER_COBS,
     ]:
         # For a serial communication interface, there are some configuration values like
         # baud rate and serial port which need to be set once but are expected to stay
@@ -112,9 +127,9 @@ def create_com_interface_default(cfg: ComCfgBase) -> Optional[ComInterface]:
         return __create_com_if(cfg)
     except ConnectionRefusedError:
         _LOGGER.exception("TCP/IP connection refused")
-        if cfg.com_if_key == CoreComInterfaces.UDP.value:
+        if cfg.com_if_key == _CIF_UDP:
             _LOGGER.warning("Make sure that a UDP server is running")
-        if cfg.com_if_key == CoreComInterfaces.TCP.value:
+        if cfg.com_if_key == _CIF_TCP:
             _LOGGER.warning("Make sure that a TCP server is running")
         sys.exit(1)
     except (IOError, OSError):
@@ -122,36 +137,55 @@ def create_com_interface_default(cfg: ComCfgBase) -> Optional[ComInterface]:
         sys.exit(1)
 
 
-def __create_com_if(cfg: ComCfgBase) -> Optional[ComInterface]:
+def __create_dummy_com_if(cfg: ComCfgBase) -> Optional[ComInterface]:
+    # This import has to stay function-local: the module imports tmtccmd.config
+    # itself, so importing it at module scope would be circular
     from tmtccmd.com.dummy import DummyComIF
+
+    return DummyComIF()
+
+
+def __create_tcpip_com_if(cfg: ComCfgBase) -> Optional[ComInterface]:
+    return create_default_tcpip_interface(cast(TcpipCfg, cfg))
+
+
+def __create_serial_com_if(cfg: ComCfgBase) -> Optional[ComInterface]:
+    serial_cfg_wrapper = cast(SerialCfgWrapper, cfg)
+    return create_default_serial_interface(
+        com_if_key=cfg.com_if_key,
+        json_cfg_path=cfg.json_cfg_path,
+        serial_cfg=serial_cfg_wrapper.serial_cfg,
+    )
+
+
+def __create_qemu_com_if(cfg: ComCfgBase) -> Optional[ComInterface]:
+    # This import has to stay function-local: the module imports tmtccmd.config
+    # itself, so importing it at module scope would be circular
     from tmtccmd.com.qemu import QEMUComIF
 
-    if (
-        cfg.com_if_key == CoreComInterfaces.UDP.value
-        or cfg.com_if_key == CoreComInterfaces.TCP.value
-    ):
-        communication_interface = create_default_tcpip_interface(cast(TcpipCfg, cfg))
-    elif cfg.com_if_key in [
-        CoreComInterfaces.SERIAL_DLE.value,
-        CoreComInterfaces.SERIAL_FIXED_FRAME.value,
-        CoreComInterfaces.SERIAL_COBS.value,
-    ]:
-        serial_cfg_wrapper = cast(SerialCfgWrapper, cfg)
-        communication_interface = create_default_serial_interface(
-            com_if_key=cfg.com_if_key,
-            json_cfg_path=cfg.json_cfg_path,
-            serial_cfg=serial_cfg_wrapper.serial_cfg,
-        )
-    elif cfg.com_if_key == CoreComInterfaces.SERIAL_QEMU.value:
-        # TODO: Move to new model where config is passed externally
-        serial_cfg = cast(SerialCfg, cfg)
-        communication_interface = QEMUComIF(
-            com_if_id=cfg.com_if_key,
-            serial_timeout=serial_cfg.serial_timeout,
-            ser_com_type=SerialCommunicationType.DLE_ENCODING,
-        )
-    else:
-        communication_interface = DummyComIF()
+    # TODO: Move to new model where config is passed externally
+    serial_cfg = cast(SerialCfg, cfg)
+    return QEMUComIF(
+        com_if_id=cfg.com_if_key,
+        serial_timeout=serial_cfg.serial_timeout,
+        ser_com_type=SerialCommunicationType.DLE_ENCODING,
+    )
+
+
+# Dispatch table which maps a COM interface key to its factory function
+__COM_IF_FACTORIES = {
+    _CIF_UDP: __create_tcpip_com_if,
+    _CIF_TCP: __create_tcpip_com_if,
+    _CIF_SER_DLE: __create_serial_com_if,
+    _CIF_SER_FIXED: __create_serial_com_if,
+    _CIF_SER_COBS: __create_serial_com_if,
+    _CIF_SER_QEMU: __create_qemu_com_if,
+}
+
+
+def __create_com_if(cfg: ComCfgBase) -> Optional[ComInterface]:
+    factory = __COM_IF_FACTORIES.get(cfg.com_if_key, __create_dummy_com_if)
+    communication_interface = factory(cfg)
     if communication_interface is None:
         _LOGGER.warning("Invalid communication interface, is None")
         return communication_interface
@@ -175,11 +209,6 @@ def default_tcpip_cfg_setup(
     :param space_packet_ids:       Required if the TCP com interface needs to parse space packets
     :return:
     """
-    from tmtccmd.com.tcpip_utils import (
-        determine_udp_send_address,
-        determine_tcp_send_address,
-    )
-
     if tcpip_type == TcpIpType.UDP:
         send_addr = determine_udp_send_address(json_cfg_path=json_cfg_path)
     elif tcpip_type == TcpIpType.TCP:
@@ -225,13 +254,13 @@ def create_default_tcpip_interface(tcpip_cfg: TcpipCfg) -> Optional[ComInterface
     :return:
     """
     communication_interface = None
-    if tcpip_cfg.com_if_key == CoreComInterfaces.UDP.value:
+    if tcpip_cfg.com_if_key == _CIF_UDP:
         communication_interface = UdpComIF(
             com_if_id=tcpip_cfg.com_if_key,
             send_address=tcpip_cfg.send_addr,
             recv_addr=tcpip_cfg.recv_addr,
         )
-    elif tcpip_cfg.com_if_key == CoreComInterfaces.TCP.value:
+    elif tcpip_cfg.com_if_key == _CIF_TCP:
         communication_interface = TcpSpacePacketsComIF(
             com_if_id=tcpip_cfg.com_if_key,
             space_packet_ids=tcpip_cfg.space_packet_ids,
@@ -254,12 +283,12 @@ def create_default_serial_interface(
     :return:
     """
     try:
-        if com_if_key == CoreComInterfaces.SERIAL_DLE.value:
+        if com_if_key == _CIF_SER_DLE:
             # Ignore the DLE config for now, it is not that important anyway
             communication_interface = SerialDleComIF(ser_cfg=serial_cfg, dle_cfg=None)
-        elif com_if_key == CoreComInterfaces.SERIAL_FIXED_FRAME.value:
+        elif com_if_key == _CIF_SER_FIXED:
             communication_interface = SerialFixedFrameComIF(ser_cfg=serial_cfg)
-        elif com_if_key == CoreComInterfaces.SERIAL_COBS.value:
+        elif com_if_key == _CIF_SER_COBS:
             communication_interface = SerialCobsComIF(ser_cfg=serial_cfg)
         else:
             # TODO: Maybe print valid keys?
@@ -300,10 +329,7 @@ def set_up_serial_cfg(
     :return:
     """
     update_global(CoreGlobalIds.USE_SERIAL, True)
-    if (
-        com_if_key == CoreComInterfaces.SERIAL_DLE.value
-        or com_if_key == CoreComInterfaces.SERIAL_FIXED_FRAME.value
-    ) and com_port == "":
+    if (com_if_key == _CIF_SER_DLE or com_if_key == _CIF_SER_FIXED) and com_port == "":
         _LOGGER.warning("Invalid serial port specified!")
         com_port = determine_com_port(json_cfg_path=json_cfg_path)
     serial_cfg_dict = get_global(CoreGlobalIds.SERIAL_CONFIG)
@@ -17,6 +17,10 @@ class HookBase(ABC):
     TMTC commander core.
     """
 
+    # Slotted base class: subclasses without their own state profit from the
+    # cheaper attribute access, subclasses with state still get a dict
+    __slots__ = ("cfg_path",)
+
     def __init__(self, json_cfg_path: Optional[str] = None):
         self.cfg_path = json_cfg_path
         if self.cfg_path is None:
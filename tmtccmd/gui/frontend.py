@@ -1,6 +1,7 @@
 """PyQt front end components for the tmtccmd framework.
 @author         R. Mueller, P. Scheurenbrand, D. Nguyen
 """
+import logging
 import os
 import sys
 import webbrowser
@@ -41,12 +42,11 @@ from tmtccmd.gui.buttons import (
     ConnectButtonWrapper,
 )
 from tmtccmd.gui.defs import SharedArgs, CONNECT_BTTN_STYLE, FrontendState
-from tmtccmd.logging import get_console_logger
 from tmtccmd.core.globals_manager import get_global, update_global
 from tmtccmd.com.tcpip_utils import TcpIpConfigIds
 import tmtccmd as mod_root
 
-LOGGER = get_console_logger()
+_LOGGER = logging.getLogger(__name__)
 
 
 class TmTcFrontend(QMainWindow, FrontendBase):
@@ -83,7 +83,7 @@ class TmTcFrontend(QMainWindow, FrontendBase):
         if os.path.isfile(logo_total_path):
             self.logo_path = logo_total_path
         else:
-            LOGGER.warning("Could not set logo, path invalid!")
+            _LOGGER.warning("Could not set logo, path invalid!")
 
     def __start_ui(self):
         self.__create_menu_bar()
@@ -150,7 +150,7 @@ class TmTcFrontend(QMainWindow, FrontendBase):
         try:
             pass
             if self.__tm_button_wrapper.is_listening():
-                LOGGER.warning("TM listener still active. Stopping it first..")
+                _LOGGER.warning("TM listener still active. Stopping it first..")
                 self.__tm_button_wrapper.stop_thread()
                 event.ignore()
             else:
@@ -275,8 +275,8 @@ class TmTcFrontend(QMainWindow, FrontendBase):
         default_service = get_global(CoreGlobalIds.CURRENT_SERVICE)
         self._service_op_code_dict = self._hook_obj.get_tmtc_definitions()
         if self._service_op_code_dict is None:
-            LOGGER.warning("Invalid service to operation code dictionary")
-            LOGGER.warning("Setting default dictionary")
+            _LOGGER.warning("Invalid service to operation code dictionary")
+            _LOGGER.warning("Setting default dictionary")
             from tmtccmd.config.globals import get_default_tmtc_defs
 
             self._service_op_code_dict = get_default_tmtc_defs()
@@ -336,11 +336,11 @@ class TmTcFrontend(QMainWindow, FrontendBase):
     def __service_index_changed(self, index: int):
         self._state.current_service = self._service_list[index]
         self.__update_op_code_combo_box()
-        LOGGER.debug("Service changed")
+        _LOGGER.debug("Service changed")
 
     def __op_code_index_changed(self, index: int):
         self._state.current_op_code = self._op_code_list[index]
-        LOGGER.debug("Op Code changed")
+        _LOGGER.debug("Op Code changed")
 
     def __update_op_code_combo_box(self):
         self.__combo_box_op_codes.clear()
@@ -357,7 +357,7 @@ class TmTcFrontend(QMainWindow, FrontendBase):
                     self._op_code_list.append(op_code_key)
                     self.__combo_box_op_codes.addItem(op_code_value[0])
                 except TypeError:
-                    LOGGER.warning(f"Invalid op code entry {op_code_value}, skipping..")
+                    _LOGGER.warning(f"Invalid op code entry {op_code_value}, skipping..")
             for (
                 op_code_key,
                 op_code_value,
@@ -366,24 +366,24 @@ class TmTcFrontend(QMainWindow, FrontendBase):
                     self._op_code_list.append(op_code_key)
                     self.__combo_box_op_codes.addItem(op_code_value[0])
                 except TypeError:
-                    LOGGER.warning(f"Invalid op code entry {op_code_value}, skipping..")
+                    _LOGGER.warning(f"Invalid op code entry {op_code_value}, skipping..")
             self._state.current_op_code = self._op_code_list[0]
 
     def __checkbox_log_update(self, state: int):
         update_global(CoreGlobalIds.PRINT_TO_FILE, state)
-        LOGGER.debug(["Enabled", "Disabled"][state == 0] + " print to log.")
+        _LOGGER.debug(["Enabled", "Disabled"][state == 0] + " print to log.")
 
     def __checkbox_console_update(self, state: bool):
         update_global(CoreGlobalIds.PRINT_TM, state)
-        LOGGER.debug(["enabled", "disabled"][state == 0] + " console print")
+        _LOGGER.debug(["enabled", "disabled"][state == 0] + " console print")
 
     def __checkbox_print_raw_data_update(self, state: int):
         update_global(CoreGlobalIds.PRINT_RAW_TM, state)
-        LOGGER.debug(["enabled", "disabled"][state == 0] + " printing of raw data")
+        _LOGGER.debug(["enabled", "disabled"][state == 0] + " printing of raw data")
 
     def __com_if_sel_index_changed(self, index: int):
         self._state.current_com_if = self._com_if_list[index][0]
-        LOGGER.debug(f"Communication IF updated: {self._com_if_list[index][1]}")
+        _LOGGER.debug(f"Communication IF updated: {self._com_if_list[index][1]}")
 
 
 class SingleCommandTable(QTableWidget):
@@ -403,33 +403,33 @@ class SingleCommandTable(QTableWidget):
 
 def checkbox_print_hk_data(state: int):
     update_global(CoreGlobalIds.PRINT_HK, state)
-    LOGGER.info(["enabled", "disabled"][state == 0] + " printing of hk data")
+    _LOGGER.info(["enabled", "disabled"][state == 0] + " printing of hk data")
 
 
 def checkbox_short_display_mode(state: int):
     update_global(CoreGlobalIds.DISPLAY_MODE, state)
-    LOGGER.info(["enabled", "disabled"][state == 0] + " short display mode")
+    _LOGGER.info(["enabled", "disabled"][state == 0] + " short display mode")
 
 
 def number_timeout(value: float):
     update_global(CoreGlobalIds.TM_TIMEOUT, value)
-    LOGGER.info("PUS TM timeout changed to: " + str(value))
+    _LOGGER.info("PUS TM timeout changed to: " + str(value))
 
 
 def number_timeout_factor(value: float):
     update_global(CoreGlobalIds.TC_SEND_TIMEOUT_FACTOR, value)
-    LOGGER.info("PUS TM timeout factor changed to: " + str(value))
+    _LOGGER.info("PUS TM timeout factor changed to: " + str(value))
 
 
 def ip_change_client(value):
     ethernet_config = get_global(CoreGlobalIds.ETHERNET_CONFIG)
     ethernet_config[TcpIpConfigIds.RECV_ADDRESS] = value
     update_global(CoreGlobalIds.ETHERNET_CONFIG, ethernet_config)
-    LOGGER.info("Client IP changed: " + value)
+    _LOGGER.info("Client IP changed: " + value)
 
 
 def ip_change_board(value):
     ethernet_config = get_global(CoreGlobalIds.ETHERNET_CONFIG)
     ethernet_config[TcpIpConfigIds.SEND_ADDRESS] = value
     update_global(CoreGlobalIds.ETHERNET_CONFIG, ethernet_config)
-    LOGGER.info("Board IP changed: " + value)
+    _LOGGER.info("Board IP changed: " + value)
@@ -20,11 +20,13 @@ class Mode(enum.IntEnum):
     RAW = 3
 
 
+# Pre-compiled mode field layout: 4 byte mode followed by 1 byte submode
+_MODE_STRUCT = struct.Struct("!IB")
+
+
 def pack_mode_data(object_id: bytes, mode: Union[Mode, int], submode: int) -> bytearray:
     """FSFW modes: Mode 0: Off, Mode 1: Mode On, Mode 2: Mode Normal, Mode 3: Mode Raw"""
-    mode_data = bytearray()
-    mode_data += object_id + struct.pack("!I", mode) + struct.pack("B", submode)
-    return mode_data
+    return bytearray(object_id) + _MODE_STRUCT.pack(mode, submode)
 
 
 @deprecation.deprecated(
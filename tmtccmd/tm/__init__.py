@@ -49,7 +49,7 @@ class SpecificApidHandlerBase(ABC):
     @abstractmethod
     def handle_tm(self, _packet: bytes, _user_args: any):
         logging.getLogger(__name__).warning(
-            f"No TM handling implemented for APID {self.apid}"
+            "No TM handling implemented for APID %d", self.apid
         )
 
 
@@ -69,12 +69,15 @@ class GenericApidHandlerBase(ABC):
 class DefaultApidHandler(GenericApidHandlerBase):
     def handle_tm(self, apid: int, _packet: bytes, _user_args: any):
         logging.getLogger(__name__).warning(
-            f"No TM handling implemented for unknown APID {apid}"
+            "No TM handling implemented for unknown APID %d", apid
         )
 
 
 HandlerDictT = Dict[int, SpecificApidHandlerBase]
 
+# The CCSDS APID field is 11 bits wide
+MAX_APID = pow(2, 11) - 1
+
 
 class CcsdsTmHandler(TmHandlerBase):
     """Generic CCSDS handler class. The user can create an instance of this class to handle
@@ -84,6 +87,11 @@ class CcsdsTmHandler(TmHandlerBase):
     def __init__(self, generic_handler: Optional[GenericApidHandlerBase]):
         super().__init__(tm_type=TmTypes.CCSDS_SPACE_PACKETS)
         self._handler_dict: HandlerDictT = dict()
+        # Flat table indexed by APID. The APID space is only 11 bits wide, so a flat
+        # list is cheap and avoids the dict hash and lookup on the packet hot path
+        self._handler_table: List[Optional[SpecificApidHandlerBase]] = [None] * (
+            MAX_APID + 1
+        )
         if generic_handler is None:
             self.generic_handler = DefaultApidHandler(None)
         else:
@@ -96,7 +104,12 @@ class CcsdsTmHandler(TmHandlerBase):
         :param handler: Handler class instance
         :return:
         """
+        if handler.apid < 0 or handler.apid > MAX_APID:
+            raise ValueError(
+                f"APID {handler.apid} outside of the valid range [0, {MAX_APID}]"
+            )
         self._handler_dict[handler.apid] = handler
+        self._handler_table[handler.apid] = handler
 
     def has_apid(self, apid: int) -> bool:
         return apid in self._handler_dict
@@ -115,7 +128,7 @@ class CcsdsTmHandler(TmHandlerBase):
         :return: True if the packet was passed to as dedicated APID handler, False otherwise
         """
         self.user_hook(apid, packet)
-        specific_handler = self._handler_dict.get(apid)
+        specific_handler = self._handler_table[apid] if 0 <= apid <= MAX_APID else None
         if specific_handler is None:
             self.generic_handler.handle_tm(apid, packet, self.generic_handler.user_args)
             return False
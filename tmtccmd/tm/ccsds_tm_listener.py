@@ -1,8 +1,6 @@
 """Contains the TmListener which can be used to listen to Telemetry in the background"""
 from typing import Dict, List, Tuple
 
-from spacepackets.ccsds.spacepacket import get_apid_from_raw_space_packet
-
 from tmtccmd.tm import TelemetryQueueT, CcsdsTmHandler
 from tmtccmd.com import ComInterface
 
@@ -45,8 +43,10 @@ class CcsdsTmListener:
         :return:
         """
         packet_list = com_if.receive()
+        # Hoist the bound method out of the per-packet loop
+        handle_packet = self.__handle_ccsds_space_packet
         for tm_packet in packet_list:
-            self.__handle_ccsds_space_packet(tm_packet)
+            handle_packet(tm_packet)
         return len(packet_list)
 
     def __handle_ccsds_space_packet(self, tm_packet: bytes):
@@ -54,7 +54,9 @@ class CcsdsTmListener:
         if len(tm_packet) < 6:
             invalid_packets.append(tm_packet)
         else:
-            apid = get_apid_from_raw_space_packet(tm_packet)
+            # Inlined APID extraction from the CCSDS primary header. This runs once per
+            # received packet, so the function call into spacepackets is skipped here
+            apid = ((tm_packet[0] & 0x07) << 8) | tm_packet[1]
             self.__tm_handler.handle_packet(apid, tm_packet)
             return True
         if len(invalid_packets) > 0:
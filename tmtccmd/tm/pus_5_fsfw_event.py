@@ -14,6 +14,10 @@ from spacepackets.ecss.pus_5_event import Subservice
 from spacepackets.ecss.tm import CdsShortTimestamp, AbstractPusTm, PusTelemetry
 from tmtccmd.pus.s5_fsfw_event_defs import Severity
 
+# Precompiled struct for the fixed layout of a full FSFW event definition:
+# event ID, four byte reporter ID and the two event parameters
+_EVENT_STRUCT = struct.Struct("!H4sII")
+
 
 @dataclasses.dataclass
 class EventDefinition:
@@ -23,9 +27,15 @@ class EventDefinition:
     param2: int
 
     def pack(self) -> bytes:
-        raw = bytearray(struct.pack("!H", self.event_id))
         if len(self.reporter_id) < 4:
             raise ValueError("reporter ID must be at least 4 bytes wide")
+        if len(self.reporter_id) == 4:
+            return bytearray(
+                _EVENT_STRUCT.pack(
+                    self.event_id, self.reporter_id, self.param1, self.param2
+                )
+            )
+        raw = bytearray(struct.pack("!H", self.event_id))
         raw.extend(self.reporter_id)
         raw.extend(struct.pack("!I", self.param1))
         raw.extend(struct.pack("!I", self.param2))
@@ -41,10 +51,7 @@ class EventDefinition:
             raise ValueError(
                 "full FSFW event definition must be at least 14 bytes wide"
             )
-        event_id = struct.unpack("!H", data[0:2])[0]
-        object_id = bytes(data[2:6])
-        param1 = struct.unpack("!I", data[6:10])[0]
-        param2 = struct.unpack("!I", data[10:14])[0]
+        event_id, object_id, param1, param2 = _EVENT_STRUCT.unpack_from(data)
         return cls(event_id, object_id, param1, param2)
 
 